@@ -1,32 +1,36 @@
 import sys
+from collections import defaultdict
 sys.path.insert(0, 'src')
 from linter import SnowflakeLinter
 from utils.file_utils import write_report
 
 l = SnowflakeLinter()
 violations = l.lint_directory('samples')
-report = 'SNOWFLAKE SQL LINTER REPORT\n'
-report += '='*60 + '\n\n'
-if not violations:
-    report += '✓ No violations found!\n'
-else:
-    report += f'Total violations: {len(violations)}\n\n'
+
+def iter_report():
+    yield 'SNOWFLAKE SQL LINTER REPORT\n'
+    yield '='*60 + '\n\n'
+    if not violations:
+        yield '✓ No violations found!\n'
+        return
+    yield f'Total violations: {len(violations)}\n\n'
     # Group by rule
-    by_rule = {}
+    by_rule = defaultdict(list)
     for v in violations:
-        by_rule.setdefault(v['rule'], []).append(v)
+        by_rule[v['rule']].append(v)
     for rule in sorted(by_rule.keys()):
-        report += '='*40 + '\n'
-        report += f'Rule: {rule} (Found {len(by_rule[rule])})\n'
-        report += '-'*40 + '\n'
+        yield '='*40 + '\n'
+        yield f'Rule: {rule} (Found {len(by_rule[rule])})\n'
+        yield '-'*40 + '\n'
         for vv in by_rule[rule]:
-            report += f"File: {vv.get('file','unknown')}  Line {vv.get('line')}  Severity: {vv.get('severity','') }\n"
-            report += f"  {vv.get('message')}\n\n"
+            yield f"File: {vv.get('file','unknown')}  Line {vv.get('line')}  Severity: {vv.get('severity','') }\n"
+            yield f"  {vv.get('message')}\n\n"
 
 out_path = 'reports/results.txt'
-write_report(out_path, report)
+write_report(out_path, iter_report())
 print('Wrote report to', out_path)
 # Print first 40 lines
-for i, line in enumerate(report.splitlines()):
-    if i<40:
-        print(line)
+with open(out_path, encoding='utf-8') as f:
+    for i, line in enumerate(f):
+        if i<40:
+            print(line, end='')
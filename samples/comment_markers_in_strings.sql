@@ -0,0 +1,6 @@
+-- Comment markers inside string literals are text, not comments
+-- Each window call below follows such a literal and must still be reported
+SELECT o.id, '--x' AS dashes, RANK() OVER (PARTITION BY o.region) AS r1
+FROM orders o;
+SELECT o.id, '/*' AS opener, RANK() OVER (PARTITION BY o.region) AS r2
+FROM orders o; /* the literal above opened no comment */
@@ -0,0 +1,5 @@
+-- Window functions nested inside another call are checked too
+SELECT
+    COALESCE(RANK() OVER (PARTITION BY s.store_id), 0) AS store_rank,
+    COALESCE(ROW_NUMBER() OVER (PARTITION BY s.store_id ORDER BY s.sold_at), 0) AS sale_seq
+FROM sales s;
@@ -0,0 +1,11 @@
+-- OVER clauses that span several lines
+-- The first call orders its window on a later line: no violation
+SELECT
+    o.customer_id,
+    ROW_NUMBER() OVER (PARTITION BY o.customer_id
+                       ORDER BY o.order_date) AS order_seq,
+    -- The second call never orders its window: WINDOW_MISSING_ORDER_BY
+    RANK() OVER (
+        PARTITION BY o.region
+    ) AS region_rank
+FROM orders o;
@@ -5,163 +5,333 @@ Orchestrates linting rules and generates reports.
 """
 
 import os
+import re
 import sys
-import importlib
-import inspect
-from typing import List, Dict, Any
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, Iterator, Optional, Pattern, Set, Tuple, Type
 from pathlib import Path
+from .utils.cache import DEFAULT_CACHE_DIR, ResultCache, content_digest
 from .utils.file_utils import read_sql_file, get_sql_files, write_report
+from .models.lint_context import LintContext
+from .models.lint_result import LintResult
+from .rules import REGISTRY, RULES_VERSION, BaseRule
 
 
+# Directories with fewer files than this are linted serially; process pool
+# startup would cost more than it saves.
+PARALLEL_MIN_FILES = 4
+
+
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process is allowed to run on.
+    
+    os.cpu_count() reports every CPU on the machine, which oversubscribes
+    the pool under taskset, cgroups or container CPU limits.
+    
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        # sched_getaffinity is not available on macOS or Windows
+        return os.cpu_count() or 1
+
+
+# Per-process linter used by _lint_file_worker (rules are loaded once per worker)
+_worker_linter = None
+
+
+def _lint_file_worker(file_path: str, with_digest: bool = False
+                      ) -> Tuple[Optional[str], Optional[List[LintResult]]]:
+    """
+    Lint a single file inside a worker process.
+    
+    Rules are stateless, so each worker loads them once and reuses them
+    for every file it is handed.
+    
+    Args:
+        file_path: Path to SQL file
+        with_digest: Also hash the content, for the parent's result cache
+        
+    Returns:
+        Tuple (content digest, violations), as SnowflakeLinter._lint_path
+    """
+    global _worker_linter
+    if _worker_linter is None:
+        _worker_linter = SnowflakeLinter()
+    return _worker_linter._lint_path(file_path, with_digest)
+
 
 class SnowflakeLinter:
     """Main linter class that applies rules to SQL files."""
     
-    def __init__(self):
-        self.rules = self._load_rules_dynamically()
+    # Rules and trigger patterns are the same for every instance, so they are
+    # built on first use and shared
+    _CACHED_RULES: Optional[List[Type[BaseRule]]] = None
+    _CACHED_TRIGGERS: Optional[Dict[str, Pattern]] = None
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_workers: int = 1):
+        """
+        Args:
+            cache_dir: Directory for the on-disk result cache; results are
+                not cached when None
+            max_workers: Processes used by lint_directory. The default of 1
+                lints serially; more starts a process pool, which callers
+                must only do under an `if __name__ == "__main__":` guard
+                (required by the spawn and forkserver start methods).
+                0 uses every CPU this process may run on
+        """
+        if SnowflakeLinter._CACHED_RULES is None:
+            SnowflakeLinter._CACHED_RULES = self._load_rules()
+            SnowflakeLinter._CACHED_TRIGGERS = self._compile_triggers(SnowflakeLinter._CACHED_RULES)
+        self.rules = list(SnowflakeLinter._CACHED_RULES)
         self.violations = []
+        self._triggers = SnowflakeLinter._CACHED_TRIGGERS
+        self.cache = ResultCache(cache_dir, self.rules_version()) if cache_dir else None
+        self.max_workers = max_workers if max_workers > 0 else _available_cpus()
     
     @staticmethod
-    def _load_rules_dynamically() -> List[Any]:
+    def _load_rules() -> List[Type[BaseRule]]:
         """
-        Dynamically load all rule classes from the rules folder.
+        Load all rule classes registered in the rules package.
+        
+        Rules are stateless, so the classes are used directly rather than
+        instantiated.
         
         Returns:
-            List of instantiated rule objects
+            List of rule classes
+        """
+        return list(REGISTRY)
+    
+    @staticmethod
+    def _compile_triggers(rules: List[Type[BaseRule]]) -> Dict[str, Pattern]:
         """
-        rules = []
-        rules_dir = Path(__file__).parent / 'rules'
+        Compile every rule's TRIGGER pattern, case-insensitively.
         
-        # Add src directory to sys.path to allow relative imports
-        src_dir = Path(__file__).parent
-        if str(src_dir) not in sys.path:
-            sys.path.insert(0, str(src_dir))
+        Triggers are kept as separate patterns rather than one alternation:
+        a rule only needs its first hit, and re searches a single pattern
+        faster than it walks every match of a combined one.
         
-        try:
-            if not rules_dir.exists():
-                return rules
+        Returns:
+            Dict mapping RULE_NAME to its compiled trigger
+        """
+        return {
+            rule.RULE_NAME: re.compile(rule.TRIGGER, re.IGNORECASE)
+            for rule in rules
+            if rule.TRIGGER
+        }
+    
+    def _fired_triggers(self, normalized_sql: str) -> Set[str]:
+        """
+        Collect the names of rules whose trigger appears in normalized SQL.
+        
+        Each trigger search stops at its first match.
+        
+        Args:
+            normalized_sql: SQL with comments removed
             
-            for file_name in os.listdir(rules_dir):
-                # Skip __init__.py and non-python files
-                if file_name.startswith('rule_') and file_name.endswith('.py'):
-                    module_name = file_name[:-3]  # Remove .py extension
-                    
-                    try:
-                        # Import the module dynamically
-                        module = importlib.import_module(f'rules.{module_name}')
-                        
-                        # Find all classes in the module that start with 'Rule'
-                        for name, obj in inspect.getmembers(module, inspect.isclass):
-                            # Check if it's a Rule class and has check method and RULE_NAME
-                            if name.startswith('Rule') and hasattr(obj, 'check') and hasattr(obj, 'RULE_NAME'):
-                                # Instantiate the rule and add to list
-                                rule_instance = obj()
-                                rules.append(rule_instance)
-                    except Exception as e:
-                        print(f"Warning: Failed to load rule module '{module_name}': {str(e)}", file=sys.stderr)
-        finally:
-            pass
-        
-        return rules
-    
-    def lint_file(self, file_path: str) -> List[Dict[str, Any]]:
+        Returns:
+            Set of RULE_NAMEs whose TRIGGER appears in the SQL
+        """
+        return {
+            rule_name
+            for rule_name, trigger in self._triggers.items()
+            if trigger.search(normalized_sql)
+        }
+    
+    def rules_version(self) -> str:
+        """
+        Identify the loaded rule set for the result cache.
+        
+        Returns:
+            RULES_VERSION followed by the names of the loaded rules
+        """
+        names = ",".join(sorted(rule.RULE_NAME for rule in self.rules))
+        return f"{RULES_VERSION}:{names}"
+    
+    def _lint_sql(self, sql_content: str, file_path: str) -> List[LintResult]:
+        """
+        Run every applicable rule over the content of one file.
+        
+        Args:
+            sql_content: Raw SQL of the file
+            file_path: File name for reporting
+            
+        Returns:
+            List of LintResult violations
+        """
+        file_violations = []
+        
+        # Comments are stripped once; the lowercased text, lines and
+        # newline offsets are derived on first use and shared by all rules
+        ctx = LintContext(sql_content)
+        
+        # The triggers decide which triggered rules need to run
+        fired = self._fired_triggers(ctx.normalized)
+        
+        for rule_cls in self.rules:
+            if rule_cls.TRIGGER and rule_cls.RULE_NAME not in fired:
+                continue
+            file_violations.extend(rule_cls.check_context(ctx, file_path))
+        
+        return file_violations
+    
+    def _lint_path(self, file_path: str, with_digest: bool = False
+                   ) -> Tuple[Optional[str], Optional[List[LintResult]]]:
+        """
+        Read and lint a single SQL file, bypassing the cache.
+        
+        Args:
+            file_path: Path to SQL file
+            with_digest: Also hash the content, so the caller can cache the
+                results without reading the file again
+        
+        Returns:
+            Tuple (content digest, violations). The digest is None unless
+            requested; the violations are None if the file could not be
+            linted (the error is printed)
+        """
+        try:
+            sql_content = read_sql_file(file_path)
+            digest = content_digest(sql_content) if with_digest else None
+            return digest, self._lint_sql(sql_content, file_path)
+        except Exception as e:
+            print(f"Error linting file {file_path}: {str(e)}")
+            return None, None
+    
+    def lint_file(self, file_path: str) -> List[LintResult]:
         """
         Lint a single SQL file.
         
+        With a cache, files whose content was linted before are answered
+        from it; call save_cache() to keep new results.
+        
         Returns:
-            List of normalized violation dictionaries.
+            List of LintResult violations.
         """
+        if self.cache is None:
+            return self._lint_path(file_path)[1] or []
+        
         try:
             sql_content = read_sql_file(file_path)
-            file_violations = []
-            
-            for rule in self.rules:
-                violations = rule.check(sql_content, file_path)
-
-                # Normalize LintResult → dict
-                for v in violations:
-                    if hasattr(v, "to_dict"):
-                        d = v.to_dict()
-                        d["file"] = file_path
-                        file_violations.append(d)
-                    else:
-                        # Already a dict
-                        v.setdefault("file", file_path)
-                        file_violations.append(v)
-
+            digest = content_digest(sql_content)
+            file_violations = self.cache.get(digest, file_path)
+            if file_violations is None:
+                file_violations = self._lint_sql(sql_content, file_path)
+                self.cache.put(digest, file_violations)
             return file_violations
         
         except Exception as e:
             print(f"Error linting file {file_path}: {str(e)}")
             return []
-
-
     
-    def lint_directory(self, directory: str) -> List[Dict[str, Any]]:
+    def save_cache(self) -> None:
+        """Write new cached results to disk (no-op without a cache)."""
+        if self.cache is not None:
+            self.cache.save()
+    
+    def lint_directory(self, directory: str) -> List[LintResult]:
         """
         Lint all SQL files in a directory.
-        Returns list of normalized violation dictionaries.
+        
+        With max_workers above 1, files are linted in parallel across a
+        process pool; small directories still fall back to serial
+        linting. With a cache, only files
+        whose content is not cached are linted, and the cache is saved
+        afterwards.
+        Returns list of LintResult violations.
         """
-        sql_files = get_sql_files(directory)
+        sql_files = list(get_sql_files(directory))
         all_violations = []
         
-        for sql_file in sql_files:
-            violations = self.lint_file(sql_file)
-
-            for v in violations:
-                if hasattr(v, "to_dict"):
-                    d = v.to_dict()
-                    d["file"] = sql_file
-                    all_violations.append(d)
-                else:
-                    v.setdefault("file", sql_file)
-                    all_violations.append(v)
+        # Cache lookups happen here, so workers never touch the cache file.
+        # An empty cache has nothing to look up, so files are not read
+        # ahead of linting; the digests come back with the results instead.
+        results: List[Optional[List[LintResult]]] = [None] * len(sql_files)
+        to_lint = list(range(len(sql_files)))
+        with_digest = self.cache is not None
+        if self.cache is not None and len(self.cache) > 0:
+            to_lint = []
+            for i, sql_file in enumerate(sql_files):
+                try:
+                    digest = content_digest(read_sql_file(sql_file))
+                except Exception:
+                    # _lint_path reports the error when it reads the file
+                    to_lint.append(i)
+                    continue
+                results[i] = self.cache.get(digest, sql_file)
+                if results[i] is None:
+                    to_lint.append(i)
+        
+        pending = [sql_files[i] for i in to_lint]
+        if self.max_workers <= 1 or len(pending) < PARALLEL_MIN_FILES:
+            linted = [self._lint_path(sql_file, with_digest) for sql_file in pending]
+        else:
+            workers = min(self.max_workers, len(pending))
+            chunksize = max(1, len(pending) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                linted = list(executor.map(_lint_file_worker, pending, repeat(with_digest),
+                                           chunksize=chunksize))
+        
+        # Files that failed to lint report nothing and are not cached
+        for i, (digest, violations) in zip(to_lint, linted):
+            if violations is not None and digest is not None:
+                self.cache.put(digest, violations)
+            results[i] = violations
+        self.save_cache()
+        
+        for violations in results:
+            if violations:
+                all_violations.extend(violations)
 
         self.violations = all_violations
         return all_violations
 
     
+    def _iter_report(self) -> Iterator[str]:
+        """
+        Yield the linting report section by section.
+        
+        Yields:
+            Report text chunks in output order
+        """
+        yield "SNOWFLAKE SQL LINTER REPORT\n"
+        yield "=" * 60 + "\n\n"
+        
+        if not self.violations:
+            yield "✓ No violations found!\n"
+            return
+        
+        # Group violations by rule
+        violations_by_rule = defaultdict(list)
+        for violation in self.violations:
+            violations_by_rule[violation.rule].append(violation)
+        
+        rule_by_name = {rule.RULE_NAME: rule for rule in self.rules}
+        
+        # Generate report for each rule using its formatter
+        for rule_name in sorted(violations_by_rule.keys()):
+            rule = rule_by_name.get(rule_name)
+            if rule is None:
+                continue
+            
+            yield from rule.iter_report(violations_by_rule[rule_name])
+    
     def generate_report(self, output_path: str) -> None:
         """
         Generate and write linting report.
         
+        Sections are written to the file as they are formatted, so the full
+        report is never held in memory.
+        
         Args:
             output_path: Path where report will be written
         """
-        report = "SNOWFLAKE SQL LINTER REPORT\n"
-        report += "=" * 60 + "\n\n"
-        
-        if not self.violations:
-            report += "✓ No violations found!\n"
-        else:
-            # Group violations by rule
-            violations_by_rule = {}
-            for violation in self.violations:
-                rule_name = violation['rule']
-                if rule_name not in violations_by_rule:
-                    violations_by_rule[rule_name] = []
-                violations_by_rule[rule_name].append(violation)
-            
-            # Generate report for each rule using its formatter
-            for rule_name in sorted(violations_by_rule.keys()):
-                violations = violations_by_rule[rule_name]
-                
-                # Find the rule object and use its format_report method
-                for rule in self.rules:
-                    if hasattr(rule, 'RULE_NAME') and rule.RULE_NAME == rule_name:
-                        if hasattr(rule, 'format_report'):
-                            report += rule.format_report(violations)
-                        else:
-                            # Fallback formatting if rule doesn't have format_report
-                            report += f"\n{'='*60}\n"
-                            report += f"Rule: {rule_name}\n"
-                            report += f"{'='*60}\n"
-                            report += f"Found {len(violations)} violation(s):\n\n"
-                            for v in violations:
-                                report += f"  {v.get('file', 'unknown')} (Line {v['line']}): {v['message']}\n"
-                        break
-        
-        write_report(output_path, report)
+        write_report(output_path, self._iter_report())
         print(f"Report written to: {output_path}")
     
     def print_violations(self) -> None:
@@ -172,7 +342,7 @@ class SnowflakeLinter:
         
         print(f"\nFound {len(self.violations)} violation(s):\n")
         for violation in self.violations:
-            print(f"  {violation['file']} (Line {violation['line']}): {violation['message']}")
+            print(f"  {violation.file} (Line {violation.line}): {violation.message}")
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -185,16 +355,16 @@ class SnowflakeLinter:
             'total_violations': len(self.violations),
             'violations_by_rule': {},
             'violations_by_severity': {},
-            'files_checked': len(set(v.get('file', 'unknown') for v in self.violations))
+            'files_checked': len(set(v.file for v in self.violations))
         }
         
         for violation in self.violations:
             # Count by rule
-            rule_name = violation['rule']
+            rule_name = violation.rule
             summary['violations_by_rule'][rule_name] = summary['violations_by_rule'].get(rule_name, 0) + 1
             
             # Count by severity
-            severity = violation.get('severity', 'UNKNOWN')
+            severity = violation.severity
             summary['violations_by_severity'][severity] = summary['violations_by_severity'].get(severity, 0) + 1
         
         return summary
@@ -234,6 +404,8 @@ Examples:
   python linter.py samples/sample1.sql
   python linter.py samples/
   python linter.py samples/ --report reports/results.txt
+  python linter.py samples/ --cache
+  python linter.py samples/ --jobs 4
         """
     )
     
@@ -256,10 +428,35 @@ Examples:
         help='Print detailed violation information'
     )
     
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse results for files whose content has not changed since the last run'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        metavar='DIR',
+        help=f'Directory for the result cache (default: {DEFAULT_CACHE_DIR}; implies --cache)'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Number of processes to lint a directory with (default: 0, every usable CPU; 1 lints serially)'
+    )
+    
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive number")
     
     # Initialize linter
-    linter = SnowflakeLinter()
+    cache_dir = args.cache_dir or (DEFAULT_CACHE_DIR if args.cache else None)
+    linter = SnowflakeLinter(cache_dir=cache_dir, max_workers=args.jobs)
     
     # Print loaded rules
     print(f"\n{'='*60}")
@@ -267,8 +464,7 @@ Examples:
     print(f"{'='*60}")
     print(f"Loaded {len(linter.rules)} rule(s):")
     for rule in linter.rules:
-        if hasattr(rule, 'RULE_NAME'):
-            print(f"  ✓ {rule.RULE_NAME}")
+        print(f"  ✓ {rule.RULE_NAME}")
     print()
     
     # Resolve path
@@ -286,6 +482,7 @@ Examples:
         print(f"Linting file: {path}")
         violations = linter.lint_file(str(path))
         linter.violations = violations  # Store in linter object
+        linter.save_cache()
     elif path.is_dir():
         print(f"Linting directory: {path}")
         violations = linter.lint_directory(str(path))
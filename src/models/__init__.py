@@ -4,5 +4,6 @@ Models package
 
 from .lint_result import LintResult
 from .lint_report import LintReport
+from .lint_context import LintContext
 
-__all__ = ['LintResult', 'LintReport']
+__all__ = ['LintResult', 'LintReport', 'LintContext']
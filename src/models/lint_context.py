@@ -0,0 +1,54 @@
+"""
+Data model for the text of one SQL file, shared by every rule.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+try:
+    from utils.sql_utils import is_ascii_sql, newline_offsets, normalize_sql
+except ImportError:
+    from ..utils.sql_utils import is_ascii_sql, newline_offsets, normalize_sql
+
+
+@dataclass
+class LintContext:
+    """
+    Raw SQL of one file plus the forms rules derive from it.
+
+    The normalized text is computed up front; the lowercased text, the
+    newline offsets and the ASCII check are computed the first time a rule
+    asks for them and then reused by every later rule.
+    """
+
+    raw: str
+    normalized: Optional[str] = field(default=None, repr=False)
+
+    _lowered: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _newline_pos: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+    _is_ascii: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Strip comments unless the caller already did."""
+        if self.normalized is None:
+            self.normalized = normalize_sql(self.raw)
+
+    @property
+    def lowered(self) -> str:
+        """Normalized SQL lowercased (lowercasing keeps every newline)."""
+        if self._lowered is None:
+            self._lowered = self.normalized.lower()
+        return self._lowered
+
+    @property
+    def newline_pos(self) -> List[int]:
+        """Offsets of every newline in the normalized SQL, for sql_utils.line_at."""
+        if self._newline_pos is None:
+            self._newline_pos = newline_offsets(self.normalized)
+        return self._newline_pos
+
+    @property
+    def is_ascii(self) -> bool:
+        """Whether re.ASCII patterns can scan the normalized SQL (see SqlPattern)."""
+        if self._is_ascii is None:
+            self._is_ascii = is_ascii_sql(self.normalized)
+        return self._is_ascii
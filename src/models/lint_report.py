@@ -2,6 +2,7 @@
 Data model for linting report containing results and metadata.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import List, Dict
 from datetime import datetime
@@ -17,31 +18,50 @@ class LintReport:
     total_files: int = 0
     total_violations: int = 0
     
+    # Lookup indexes kept in sync by add_result/add_results
+    _by_rule: Dict[str, List[LintResult]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False, compare=False)
+    _by_severity: Dict[str, List[LintResult]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False, compare=False)
+    _by_file: Dict[str, List[LintResult]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False, compare=False)
+    
     def __post_init__(self):
-        """Update counts after initialization."""
+        """Update counts and indexes after initialization."""
         self.total_violations = len(self.results)
+        for result in self.results:
+            self._index(result)
+    
+    def _index(self, result: LintResult) -> None:
+        """Add a result to the rule, severity and file indexes."""
+        self._by_rule[result.rule].append(result)
+        self._by_severity[result.severity].append(result)
+        self._by_file[result.file].append(result)
     
     def add_result(self, result: LintResult) -> None:
         """Add a result to the report."""
         self.results.append(result)
+        self._index(result)
         self.total_violations = len(self.results)
     
     def add_results(self, results: List[LintResult]) -> None:
         """Add multiple results to the report."""
         self.results.extend(results)
+        for result in results:
+            self._index(result)
         self.total_violations = len(self.results)
     
     def get_results_by_rule(self, rule_name: str) -> List[LintResult]:
         """Get all results for a specific rule."""
-        return [r for r in self.results if r.rule == rule_name]
+        return list(self._by_rule.get(rule_name, []))
     
     def get_results_by_severity(self, severity: str) -> List[LintResult]:
         """Get all results for a specific severity."""
-        return [r for r in self.results if r.severity == severity]
+        return list(self._by_severity.get(severity, []))
     
     def get_results_by_file(self, file_name: str) -> List[LintResult]:
         """Get all results for a specific file."""
-        return [r for r in self.results if r.file == file_name]
+        return list(self._by_file.get(file_name, []))
     
     def get_summary(self) -> Dict[str, int]:
         """Get summary statistics."""
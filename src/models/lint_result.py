@@ -2,11 +2,16 @@
 Data model for a single linting result/violation.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 
-@dataclass
+# __slots__ roughly halves per-result memory; dataclass(slots=True) needs 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LintResult:
     """Represents a single linting violation."""
     
@@ -22,6 +27,17 @@ class LintResult:
         """Format result as string."""
         return f"{self.file}:{self.line} [{self.severity}] {self.rule}: {self.message}"
     
+    def __getitem__(self, key: str) -> Any:
+        """Dictionary-style field access, for callers written against dict violations."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style field access with a default."""
+        return getattr(self, key, default)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
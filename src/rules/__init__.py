@@ -1,4 +1,43 @@
+"""
+Rules package
+
+Rule classes subclass BaseRule and add themselves to REGISTRY with the
+@register decorator when their module is imported below.
+"""
+
+from .base import BaseRule
+
+REGISTRY = []
+
+# Bump whenever a rule's findings change, so cached results from older rules
+# are discarded (see utils/cache.py)
+RULES_VERSION = 1
+
+
+def register(cls):
+    """Class decorator that adds a rule class to REGISTRY."""
+    if not issubclass(cls, BaseRule):
+        raise TypeError(f"{cls.__name__} must subclass BaseRule to be registered")
+    if cls.check_context is BaseRule.check_context:
+        raise TypeError(f"{cls.__name__} must implement check_context to be registered")
+    REGISTRY.append(cls)
+    return cls
+
+
 from .rule_select_star import RuleSelectStar
 from .rule_unqualified_columns import RuleUnqualifiedColumns
+from .rule_window_orderby import RuleWindowOrderBy
+from .rule_limit_without_orderby import RuleLimitWithoutOrderBy
+from .rule_keyword_case import RuleKeywordCase
 
-__all__ = ['RuleSelectStar', 'RuleUnqualifiedColumns']
+__all__ = [
+    'BaseRule',
+    'REGISTRY',
+    'RULES_VERSION',
+    'register',
+    'RuleSelectStar',
+    'RuleUnqualifiedColumns',
+    'RuleWindowOrderBy',
+    'RuleLimitWithoutOrderBy',
+    'RuleKeywordCase',
+]
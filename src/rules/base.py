@@ -0,0 +1,91 @@
+"""
+Base class for linting rules.
+"""
+
+from typing import Any, Iterator, List, Optional
+try:
+    from models.lint_context import LintContext
+except ImportError:
+    from ..models.lint_context import LintContext
+
+
+class BaseRule:
+    """Common interface for all linting rules."""
+    
+    RULE_NAME = ""
+    RULE_DESCRIPTION = ""
+    SEVERITY = ""
+    
+    # Regex that must appear in the normalized SQL for the rule to report
+    # anything; None means the rule always runs
+    TRIGGER: Optional[str] = None
+    
+    @staticmethod
+    def check_context(ctx: LintContext, file_name: str = "") -> List[Any]:
+        """
+        Check one file's SQL and return the violations found.
+        
+        Every rule must override this; register() rejects rules that do not.
+        
+        Args:
+            ctx: Raw SQL of the file and the forms derived from it, shared
+                with the other rules
+            file_name: Optional file name for reporting
+            
+        Returns:
+            List of LintResult objects with violations
+        """
+        raise NotImplementedError
+    
+    @classmethod
+    def check(cls, sql: str, file_name: str = "", normalized_sql: Optional[str] = None) -> List[Any]:
+        """
+        Check SQL and return the violations found.
+        
+        Builds a throwaway LintContext for the SQL and runs check_context.
+        
+        Args:
+            sql: SQL query string to check
+            file_name: Optional file name for reporting
+            normalized_sql: SQL with comments already removed (computed if omitted)
+            
+        Returns:
+            List of LintResult objects with violations
+        """
+        return cls.check_context(LintContext(sql, normalized_sql), file_name)
+    
+    @classmethod
+    def iter_report(cls, violations: List[Any]) -> Iterator[str]:
+        """
+        Yield the report for this rule's violations chunk by chunk.
+        
+        Rules normally override this; the default lists each violation on
+        one line.
+        
+        Args:
+            violations: List of LintResult objects
+            
+        Yields:
+            Report text chunks in output order
+        """
+        yield (
+            f"\n{'='*60}\n"
+            f"Rule: {cls.RULE_NAME}\n"
+            f"{'='*60}\n"
+            f"Found {len(violations)} violation(s):\n\n"
+        )
+        for v in violations:
+            yield f"  {v.file} (Line {v.line}): {v.message}\n"
+    
+    @classmethod
+    def format_report(cls, violations: List[Any]) -> str:
+        """
+        Format violations into a readable report.
+        
+        Args:
+            violations: List of LintResult objects
+            
+        Returns:
+            Formatted report string (the chunks of iter_report joined)
+        """
+        return "".join(cls.iter_report(violations))
@@ -3,19 +3,50 @@ Rule: Keyword Case Detection
 
 Detects SQL keywords that are not uppercase.
 
-This implements a simple heuristic scanner over lines of SQL and flags
+This implements a simple heuristic scanner over the SQL text and flags
 occurrences of core SQL keywords that are not fully uppercase in the source.
 """
 
 import re
-from typing import List, Dict
+from typing import Iterator, List
 try:
-    from utils.sql_utils import normalize_sql
+    from models.lint_context import LintContext
+    from models.lint_result import LintResult
+    from utils.sql_utils import SqlPattern
 except ImportError:
-    from ..utils.sql_utils import normalize_sql
+    from ..models.lint_context import LintContext
+    from ..models.lint_result import LintResult
+    from ..utils.sql_utils import SqlPattern
+from . import BaseRule, register
+
+
+# Single- or double-quoted literals. They do not span lines, matching the
+# original line-by-line scan.
+_QUOTE_PATTERN = r"'(?:[^'\n]|'')*'|\"(?:[^\"\n]|\"\")*\""
+
+
+def _compile_scanner(keywords: List[str]) -> SqlPattern:
+    """
+    Compile a single case-insensitive scanner for quoted literals and keywords.
+
+    Quoted literals are matched by the 'quote' group so the caller can skip
+    them; keywords inside string literals are therefore never reported.
+    Longer keywords are listed first so multi-word keywords (e.g. LEFT JOIN)
+    win over the single words they contain. Words of a multi-word keyword
+    must be on the same line.
+    """
+    alternatives = [
+        r"[^\S\n]+".join(map(re.escape, kw.split()))
+        for kw in sorted(keywords, key=len, reverse=True)
+    ]
+    return SqlPattern(
+        r"(?P<quote>" + _QUOTE_PATTERN + r")|\b(?:" + "|".join(alternatives) + r")\b",
+        re.IGNORECASE,
+    )
 
 
-class RuleKeywordCase:
+@register
+class RuleKeywordCase(BaseRule):
     RULE_NAME = "KEYWORD_CASE"
     RULE_DESCRIPTION = "Ensure core SQL keywords are uppercase"
     SEVERITY = "INFO"
@@ -37,92 +68,62 @@ class RuleKeywordCase:
         "on",
     ]
 
-    @staticmethod
-    def _mask_quotes(line: str) -> str:
-        """
-        Replace contents within single or double quotes with spaces so that
-        regex matching does not accidentally match keywords inside string
-        literals. Keeps length same so indices remain valid.
-        """
-        def _replacer(m):
-            return ' ' * (len(m.group(0)))
-
-        # Mask single-quoted strings
-        line = re.sub(r"'([^']|'')*'", _replacer, line)
-        # Mask double-quoted strings
-        line = re.sub(r'"([^"]|"")*"', _replacer, line)
-        return line
+    # Quotes and all keywords compiled once into one scanner so the file is
+    # walked in a single pass
+    _SCANNER_RE = _compile_scanner(KEYWORDS)
 
     @staticmethod
-    def check(sql: str, file_name: str = "") -> List[Dict]:
+    def check_context(ctx: LintContext, file_name: str = "") -> List[LintResult]:
         """
         Check SQL source for keywords not in uppercase.
 
-        Returns a list of violation dictionaries.
+        The normalized text is scanned as a whole; its original case is
+        what this rule inspects, so ctx.lowered is not used.
+
+        Returns a list of LintResult objects.
         """
-        violations: List[Dict] = []
-
-        normalized_sql = normalize_sql(sql)
-        lines = normalized_sql.split('\n')
-
-        # Precompile patterns for each keyword and sort by length (longer first)
-        patterns = []
-        for kw in RuleKeywordCase.KEYWORDS:
-            parts = kw.split()
-            if len(parts) == 1:
-                pat = re.compile(r"\b" + re.escape(parts[0]) + r"\b", re.IGNORECASE)
-            else:
-                pat = re.compile(r"\b" + r"\s+".join(map(re.escape, parts)) + r"\b", re.IGNORECASE)
-            patterns.append((kw, pat))
-
-        # Sort patterns by keyword length descending so multi-word patterns take precedence
-        patterns.sort(key=lambda x: len(x[0]), reverse=True)
-
-        for line_num, raw_line in enumerate(lines, start=1):
-            # Mask quoted content so keywords inside strings are ignored
-            line = RuleKeywordCase._mask_quotes(raw_line)
-
-            accepted_spans = []  # list of (start, end) spans already matched
-
-            for kw, pat in patterns:
-                for m in pat.finditer(line):
-                    s, e = m.start(), m.end()
-                    # Skip if this match falls inside an already accepted span
-                    in_span = False
-                    for (as_, ae) in accepted_spans:
-                        if s >= as_ and e <= ae:
-                            in_span = True
-                            break
-                    if in_span:
-                        continue
-
-                    matched_text = raw_line[s:e]
-                    # If matched text is not all uppercase, flag it
-                    if matched_text != matched_text.upper():
-                        violations.append({
-                            "rule": RuleKeywordCase.RULE_NAME,
-                            "severity": RuleKeywordCase.SEVERITY,
-                            "line": line_num,
-                            "file": file_name,
-                            "message": f"Keyword '{matched_text}' should be uppercase.",
-                            "description": RuleKeywordCase.RULE_DESCRIPTION,
-                        })
-                        accepted_spans.append((s, e))
+        violations: List[LintResult] = []
+        normalized_sql = ctx.normalized
+
+        # One pass over the whole file; quoted literals are consumed by the
+        # scanner and skipped, and line numbers are tracked by counting
+        # newlines between consecutive violations
+        line_num = 1
+        last_pos = 0
+        scanner = RuleKeywordCase._SCANNER_RE.for_sql(normalized_sql, ctx.is_ascii)
+        for m in scanner.finditer(normalized_sql):
+            if m.lastgroup == 'quote':
+                continue
+            matched_text = m.group(0)
+            # If matched text is not all uppercase, flag it (isupper avoids
+            # allocating an uppercased copy for every match)
+            if not matched_text.isupper():
+                line_num += normalized_sql.count('\n', last_pos, m.start())
+                last_pos = m.start()
+                violations.append(LintResult(
+                    rule=RuleKeywordCase.RULE_NAME,
+                    severity=RuleKeywordCase.SEVERITY,
+                    line=line_num,
+                    file=file_name,
+                    message=f"Keyword '{matched_text}' should be uppercase.",
+                    description=RuleKeywordCase.RULE_DESCRIPTION,
+                ))
 
         return violations
 
     @staticmethod
-    def format_report(violations: List[Dict]) -> str:
+    def iter_report(violations: List[LintResult]) -> Iterator[str]:
         if not violations:
-            return f"✓ No {RuleKeywordCase.RULE_NAME} violations found\n"
-
-        report = f"\n{'='*60}\n"
-        report += f"Rule: {RuleKeywordCase.RULE_NAME}\n"
-        report += f"Description: {RuleKeywordCase.RULE_DESCRIPTION}\n"
-        report += f"Severity: {RuleKeywordCase.SEVERITY}\n"
-        report += f"{'='*60}\n"
-        report += f"Found {len(violations)} violation(s):\n\n"
+            yield f"✓ No {RuleKeywordCase.RULE_NAME} violations found\n"
+            return
+
+        yield (
+            f"\n{'='*60}\n"
+            f"Rule: {RuleKeywordCase.RULE_NAME}\n"
+            f"Description: {RuleKeywordCase.RULE_DESCRIPTION}\n"
+            f"Severity: {RuleKeywordCase.SEVERITY}\n"
+            f"{'='*60}\n"
+            f"Found {len(violations)} violation(s):\n\n"
+        )
         for v in violations:
-            report += f"  File: {v.get('file', 'unknown')}\n"
-            report += f"  Line {v['line']}: {v['message']}\n\n"
-        return report
+            yield f"  File: {v.file}\n  Line {v.line}: {v.message}\n\n"
@@ -14,34 +14,94 @@ Example valid:
 """
 
 import re
-from typing import List, Dict, Any
+from typing import Iterator, List
 try:
-    from utils.sql_utils import normalize_sql
+    from models.lint_context import LintContext
+    from models.lint_result import LintResult
 except ImportError:
-    from ..utils.sql_utils import normalize_sql
+    from ..models.lint_context import LintContext
+    from ..models.lint_result import LintResult
+from . import BaseRule, register
 
 
-class RuleLimitWithoutOrderBy:
+# Patterns run against lowercased SQL, so they are plain case-sensitive
+# literals rather than re.IGNORECASE searches.
+# LIMIT followed by a number or expression (not just used as a name). Only
+# existence is tested, and digits are word characters, so one character of
+# the number or expression is enough.
+_LIMIT_CLAUSE_RE = re.compile(r'\blimit\s+[\w.]')
+_LIMIT_RE = re.compile(r'\blimit\b')
+_ORDER_BY_RE = re.compile(r'\border\s+by\b')
+
+
+@register
+class RuleLimitWithoutOrderBy(BaseRule):
     """Detects LIMIT without ORDER BY in SQL queries."""
     
     RULE_NAME = "LIMIT_WITHOUT_ORDER_BY"
     RULE_DESCRIPTION = "LIMIT should be used with ORDER BY to ensure deterministic results"
     SEVERITY = "WARNING"
     
+    # Text that must appear in the normalized SQL for this rule to report anything
+    TRIGGER = r'\bLIMIT\b'
+    
+    @staticmethod
+    def _has_limit_lower(sql_lower: str) -> bool:
+        """
+        Check if lowercased SQL contains LIMIT clause (not as a column alias).
+        
+        Args:
+            sql_lower: Lowercased SQL query string
+            
+        Returns:
+            True if LIMIT clause is found, False otherwise
+        """
+        return bool(_LIMIT_CLAUSE_RE.search(sql_lower))
+    
+    @staticmethod
+    def _has_order_by_lower(sql_lower: str) -> bool:
+        """
+        Check if lowercased SQL contains ORDER BY clause.
+        
+        Args:
+            sql_lower: Lowercased SQL query string
+            
+        Returns:
+            True if ORDER BY is found, False otherwise
+        """
+        return bool(_ORDER_BY_RE.search(sql_lower))
+    
+    @staticmethod
+    def _find_limit_line_lower(sql_lower: str) -> int:
+        """
+        Find the line number where LIMIT first appears in lowercased SQL.
+        
+        Args:
+            sql_lower: Lowercased SQL query string
+            
+        Returns:
+            Line number (1-indexed) where LIMIT is found, or 0 if not found
+        """
+        # Search the whole text and count newlines before the match rather
+        # than splitting the file into a list of lines
+        match = _LIMIT_RE.search(sql_lower)
+        if match is None:
+            return 0
+        
+        return sql_lower.count('\n', 0, match.start()) + 1
+    
     @staticmethod
     def has_limit(sql: str) -> bool:
         """
         Check if SQL contains LIMIT clause (not as a column alias).
         
         Args:
-            sql: SQL query string
+            sql: SQL query string, in any case
             
         Returns:
             True if LIMIT clause is found, False otherwise
         """
-        # Look for LIMIT followed by a number or expression (not just used as a name)
-        pattern = r'\bLIMIT\s+(\d+|[\w.]+)'
-        return bool(re.search(pattern, sql, re.IGNORECASE))
+        return RuleLimitWithoutOrderBy._has_limit_lower(sql.lower())
     
     @staticmethod
     def has_order_by(sql: str) -> bool:
@@ -49,13 +109,12 @@ class RuleLimitWithoutOrderBy:
         Check if SQL contains ORDER BY clause.
         
         Args:
-            sql: SQL query string
+            sql: SQL query string, in any case
             
         Returns:
             True if ORDER BY is found, False otherwise
         """
-        pattern = r'\bORDER\s+BY\b'
-        return bool(re.search(pattern, sql, re.IGNORECASE))
+        return RuleLimitWithoutOrderBy._has_order_by_lower(sql.lower())
     
     @staticmethod
     def find_limit_line(sql: str) -> int:
@@ -63,83 +122,75 @@ class RuleLimitWithoutOrderBy:
         Find the line number where LIMIT first appears.
         
         Args:
-            sql: SQL query string
+            sql: SQL query string, in any case
             
         Returns:
             Line number (1-indexed) where LIMIT is found, or 0 if not found
         """
-        lines = sql.split('\n')
-        pattern = r'\bLIMIT\b'
-        
-        for line_num, line in enumerate(lines, start=1):
-            if re.search(pattern, line, re.IGNORECASE):
-                return line_num
-        
-        return 0
+        return RuleLimitWithoutOrderBy._find_limit_line_lower(sql.lower())
     
     @staticmethod
-    def check(sql: str, file_name: str = "") -> List[Dict[str, Any]]:
+    def check_context(ctx: LintContext, file_name: str = "") -> List[LintResult]:
         """
         Check for LIMIT without ORDER BY in SQL.
         
         Args:
-            sql: SQL query string to check
+            ctx: SQL of the file being checked, shared with the other rules
             file_name: Optional file name for reporting
             
         Returns:
-            List of violation dictionaries
+            List of LintResult objects with violations
         """
         violations = []
         
-        # Normalize SQL (remove comments)
-        normalized_sql = normalize_sql(sql)
+        # Normalized SQL lowercased once per file and shared across rules
+        sql_lower = ctx.lowered
         
         # Check if query has LIMIT
-        if not RuleLimitWithoutOrderBy.has_limit(normalized_sql):
+        if not RuleLimitWithoutOrderBy._has_limit_lower(sql_lower):
             return violations
         
         # Check if query has ORDER BY
-        if not RuleLimitWithoutOrderBy.has_order_by(normalized_sql):
-            # Find which line the LIMIT is on
-            limit_line = RuleLimitWithoutOrderBy.find_limit_line(normalized_sql)
+        if not RuleLimitWithoutOrderBy._has_order_by_lower(sql_lower):
+            # Find which line the LIMIT is on (lowercasing keeps every newline)
+            limit_line = RuleLimitWithoutOrderBy._find_limit_line_lower(sql_lower)
             
             if limit_line > 0:
-                violation = {
-                    "rule": RuleLimitWithoutOrderBy.RULE_NAME,
-                    "severity": RuleLimitWithoutOrderBy.SEVERITY,
-                    "line": limit_line,
-                    "file": file_name,
-                    "message": "LIMIT used without ORDER BY — results may be nondeterministic.",
-                    "description": RuleLimitWithoutOrderBy.RULE_DESCRIPTION
-                }
-                violations.append(violation)
+                result = LintResult(
+                    rule=RuleLimitWithoutOrderBy.RULE_NAME,
+                    severity=RuleLimitWithoutOrderBy.SEVERITY,
+                    line=limit_line,
+                    file=file_name,
+                    message="LIMIT used without ORDER BY — results may be nondeterministic.",
+                    description=RuleLimitWithoutOrderBy.RULE_DESCRIPTION
+                )
+                violations.append(result)
         
         return violations
     
     @staticmethod
-    def format_report(violations: List[Dict[str, Any]]) -> str:
+    def iter_report(violations: List[LintResult]) -> Iterator[str]:
         """
-        Format violations into a readable report.
+        Yield the report for the given violations chunk by chunk.
         
         Args:
-            violations: List of violation dictionaries
+            violations: List of LintResult objects
             
-        Returns:
-            Formatted report string
+        Yields:
+            Report text chunks in output order
         """
         if not violations:
-            return f"✓ No {RuleLimitWithoutOrderBy.RULE_NAME} violations found\n"
+            yield f"✓ No {RuleLimitWithoutOrderBy.RULE_NAME} violations found\n"
+            return
         
-        report = f"\n{'='*60}\n"
-        report += f"Rule: {RuleLimitWithoutOrderBy.RULE_NAME}\n"
-        report += f"Description: {RuleLimitWithoutOrderBy.RULE_DESCRIPTION}\n"
-        report += f"Severity: {RuleLimitWithoutOrderBy.SEVERITY}\n"
-        report += f"{'='*60}\n"
-        report += f"Found {len(violations)} violation(s):\n\n"
+        yield (
+            f"\n{'='*60}\n"
+            f"Rule: {RuleLimitWithoutOrderBy.RULE_NAME}\n"
+            f"Description: {RuleLimitWithoutOrderBy.RULE_DESCRIPTION}\n"
+            f"Severity: {RuleLimitWithoutOrderBy.SEVERITY}\n"
+            f"{'='*60}\n"
+            f"Found {len(violations)} violation(s):\n\n"
+        )
         
         for violation in violations:
-            report += f"  File: {violation.get('file', 'unknown')}\n"
-            report += f"  Line {violation['line']}: {violation['message']}\n"
-            report += "\n"
-        
-        return report
+            yield f"  File: {violation.file}\n  Line {violation.line}: {violation.message}\n\n"
@@ -8,15 +8,20 @@ SELECT * should generally be avoided in production code as it:
 - Can impact performance
 """
 
-import re
-from typing import List
+from typing import Iterator, List
 try:
+    from models.lint_context import LintContext
     from models.lint_result import LintResult
+    from utils.sql_utils import SELECT_STAR_RE
 except ImportError:
+    from ..models.lint_context import LintContext
     from ..models.lint_result import LintResult
+    from ..utils.sql_utils import SELECT_STAR_RE
+from . import BaseRule, register
 
 
-class RuleSelectStar:
+@register
+class RuleSelectStar(BaseRule):
     """Detects SELECT * usage in SQL queries."""
     
     RULE_NAME = "SELECT_STAR"
@@ -24,26 +29,40 @@ class RuleSelectStar:
     SEVERITY = "WARNING"
     
     @staticmethod
-    def check(sql: str, file_name: str = "") -> List[LintResult]:
+    def check_context(ctx: LintContext, file_name: str = "") -> List[LintResult]:
         """
         Check for SELECT * instances in SQL.
         
         Args:
-            sql: SQL query string to check
+            ctx: SQL of the file being checked, shared with the other rules
             file_name: Optional file name for reporting
             
         Returns:
             List of LintResult objects with violations
         """
         violations = []
-        lines = sql.split('\n')
+        # SELECT * is matched against the raw SQL, not the normalized text
+        sql = ctx.raw
         
-        # Pattern to match SELECT * (case-insensitive, accounting for whitespace)
-        pattern = r'\bselect\s+\*'
+        # Cheap substring test: no '*' anywhere means no SELECT *
+        if '*' not in sql:
+            return violations
         
-        for line_num, line in enumerate(lines, start=1):
-            matches = re.finditer(pattern, line, re.IGNORECASE)
-            for match in matches:
+        # Jump from one '*' to the next and only run the regex on the lines
+        # that contain one. Line numbers come from counting newlines between
+        # visited lines, so the file is never split into a list of lines.
+        line_num = 1
+        last_line_start = 0
+        star_pos = sql.find('*')
+        while star_pos != -1:
+            line_start = sql.rfind('\n', 0, star_pos) + 1
+            line_end = sql.find('\n', star_pos)
+            if line_end == -1:
+                line_end = len(sql)
+            line_num += sql.count('\n', last_line_start, line_start)
+            last_line_start = line_start
+            
+            for match in SELECT_STAR_RE.finditer(sql, line_start, line_end):
                 result = LintResult(
                     rule=RuleSelectStar.RULE_NAME,
                     severity=RuleSelectStar.SEVERITY,
@@ -53,33 +72,34 @@ class RuleSelectStar:
                     description=RuleSelectStar.RULE_DESCRIPTION
                 )
                 violations.append(result)
+            
+            star_pos = sql.find('*', line_end)
         
         return violations
     
     @staticmethod
-    def format_report(violations: List[LintResult]) -> str:
+    def iter_report(violations: List[LintResult]) -> Iterator[str]:
         """
-        Format violations into a readable report.
+        Yield the report for the given violations chunk by chunk.
         
         Args:
             violations: List of LintResult objects
             
-        Returns:
-            Formatted report string
+        Yields:
+            Report text chunks in output order
         """
         if not violations:
-            return f"No {RuleSelectStar.RULE_NAME} violations found\n"
+            yield f"No {RuleSelectStar.RULE_NAME} violations found\n"
+            return
         
-        report = f"\n{'='*60}\n"
-        report += f"Rule: {RuleSelectStar.RULE_NAME}\n"
-        report += f"Description: {RuleSelectStar.RULE_DESCRIPTION}\n"
-        report += f"Severity: {RuleSelectStar.SEVERITY}\n"
-        report += f"{'='*60}\n"
-        report += f"Found {len(violations)} violation(s):\n\n"
+        yield (
+            f"\n{'='*60}\n"
+            f"Rule: {RuleSelectStar.RULE_NAME}\n"
+            f"Description: {RuleSelectStar.RULE_DESCRIPTION}\n"
+            f"Severity: {RuleSelectStar.SEVERITY}\n"
+            f"{'='*60}\n"
+            f"Found {len(violations)} violation(s):\n\n"
+        )
         
         for violation in violations:
-            report += f"  File: {violation.file}\n"
-            report += f"  Line {violation.line}: {violation.message}\n"
-            report += "\n"
-        
-        return report
+            yield f"  File: {violation.file}\n  Line {violation.line}: {violation.message}\n\n"
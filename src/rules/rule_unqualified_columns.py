@@ -9,89 +9,149 @@ Phase 2 (Future): Full AST parsing for complex queries
 """
 
 import re
-from typing import List, Set, Tuple
+from typing import Iterator, List, Optional, Tuple
 try:
+    from models.lint_context import LintContext
     from models.lint_result import LintResult
-    from utils.sql_utils import normalize_sql
+    from utils.sql_utils import SqlPattern, is_ascii_sql
 except ImportError:
+    from ..models.lint_context import LintContext
     from ..models.lint_result import LintResult
-    from ..utils.sql_utils import normalize_sql
+    from ..utils.sql_utils import SqlPattern, is_ascii_sql
+from . import BaseRule, register
 
 
-class RuleUnqualifiedColumns:
+# FROM table_name alias or table_name AS alias
+# Matches: FROM table1 t, FROM schema.table1 t, FROM table1 AS t
+_FROM_ALIAS_RE = SqlPattern(r'FROM\s+[\w.]+\s+(?:AS\s+)?(\w+)', re.IGNORECASE)
+# SELECT starts a column list; FROM, WHERE, GROUP BY, ORDER BY, etc. end it.
+# The words of GROUP BY / ORDER BY must be on one line, as when lines were
+# scanned one at a time.
+_SELECT_RE = SqlPattern(r'\bSELECT\b', re.IGNORECASE)
+_STOP_CLAUSE_RE = SqlPattern(r'\b(?:FROM|WHERE|GROUP[^\S\n]+BY|ORDER[^\S\n]+BY|LIMIT|HAVING)\b', re.IGNORECASE)
+# Column names: word characters, dots (for qualified columns)
+# Match: col, t.col, schema.table.col, CAST(...), COUNT(*), etc.
+# MULTILINE lets ^ and $ match at line boundaries inside a multi-line region
+# The run is taken greedily; it can only end where the lookahead holds, so
+# this matches the same tokens as a lazy run with less backtracking
+_COL_RE = SqlPattern(r'(?:^|[,\s(])([\w.]+)(?=[,\s)$]|$)', re.MULTILINE)
+# SQL keywords that the column pattern picks up but are not columns
+_COLUMN_KEYWORDS = frozenset(('SELECT', 'DISTINCT', 'AS', 'FROM', 'WHERE', 'GROUP', 'ORDER', 'BY', 'HAVING',
+                              'JOIN', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'ON', 'LIMIT', 'OFFSET'))
+# Aggregates, functions and CASE keywords that are not column references
+_AGG_KEYWORDS = frozenset(('COUNT', 'SUM', 'AVG', 'MAX', 'MIN', 'DISTINCT', 'CAST', 'CASE', 'WHEN', 'THEN',
+                           'ELSE', 'END'))
+# Constants and special values
+_CONSTANTS = frozenset(('*', 'NULL', 'TRUE', 'FALSE'))
+
+
+@register
+class RuleUnqualifiedColumns(BaseRule):
     """Detects unqualified columns in SELECT statements."""
     
     RULE_NAME = "UNQUALIFIED_COLUMNS"
     RULE_DESCRIPTION = "Detects columns that are not qualified with table alias/name"
     SEVERITY = "WARNING"
     
+    # Text that must appear in the normalized SQL for this rule to report anything
+    TRIGGER = r'FROM'
+    
     @staticmethod
-    def extract_table_aliases(sql: str) -> Set[str]:
+    def extract_table_aliases(sql: str, ctx: Optional[LintContext] = None) -> Iterator[str]:
         """
         Extract table aliases from FROM clause.
         
+        Aliases are produced lazily, so a caller that only needs to know
+        whether there is one stops the scan at the first.
+        
         Args:
             sql: SQL query string
+            ctx: Context whose normalized SQL is sql, to reuse its ASCII check
             
-        Returns:
-            Set of table aliases found
+        Yields:
+            Table aliases in the order found (repeats included)
         """
-        aliases = set()
-        
-        # Pattern to match: FROM table_name alias or table_name AS alias
-        # Matches: FROM table1 t, FROM schema.table1 t, FROM table1 AS t
-        pattern = r'FROM\s+[\w.]+\s+(?:AS\s+)?(\w+)'
-        matches = re.finditer(pattern, sql, re.IGNORECASE)
-        
-        for match in matches:
+        is_ascii = None if ctx is None else ctx.is_ascii
+        for match in _FROM_ALIAS_RE.for_sql(sql, is_ascii).finditer(sql):
             alias = match.group(1)
             # Avoid capturing SQL keywords
             if alias.upper() not in ('WHERE', 'JOIN', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'ON', 'GROUP', 'ORDER', 'LIMIT'):
-                aliases.add(alias)
-        
-        return aliases
+                yield alias
     
     @staticmethod
-    def extract_select_columns(sql: str) -> List[Tuple[int, str]]:
+    def extract_select_columns(sql: str, ctx: Optional[LintContext] = None) -> Iterator[Tuple[int, str]]:
         """
         Extract column references from SELECT clause.
         
+        Column lists are found as regions of whole lines: from a line with
+        SELECT up to (not including) the next line with a stopping clause
+        such as FROM or WHERE. A SELECT line that has a stopping clause of
+        its own is skipped. Only those regions are scanned for columns.
+        
         Args:
             sql: SQL query string
+            ctx: Context whose normalized SQL is sql, to reuse its ASCII check
             
-        Returns:
-            List of tuples (line_number, column_name)
+        Yields:
+            Tuples (line_number, column_name), each pair once, in the order
+            first found
         """
-        lines = sql.split('\n')
-        columns = []
-        
-        in_select = False
-        select_start_line = 0
-        
-        for line_num, line in enumerate(lines, start=1):
-            # Check if SELECT starts on this line
-            if re.search(r'\bSELECT\b', line, re.IGNORECASE):
-                in_select = True
-                select_start_line = line_num
+        n = len(sql)
+        
+        # One check picks the pattern variant for the whole text
+        is_ascii = is_ascii_sql(sql) if ctx is None else ctx.is_ascii
+        select_re = _SELECT_RE.for_sql(sql, is_ascii)
+        stop_clause_re = _STOP_CLAUSE_RE.for_sql(sql, is_ascii)
+        col_re = _COL_RE.for_sql(sql, is_ascii)
+        
+        # Line numbers are tracked by counting newlines between consecutive
+        # columns, so the file is never split into a list of lines. They
+        # only ever increase, so a repeated column can only repeat on the
+        # current line; the set of columns seen is cleared on each new line.
+        line_num = 1
+        last_pos = 0
+        seen_on_line = set()
+        pos = 0
+        while True:
+            select = select_re.search(sql, pos)
+            if select is None:
+                break
+            line_start = sql.rfind('\n', 0, select.start()) + 1
+            line_end = sql.find('\n', select.end())
+            if line_end < 0:
+                line_end = n
             
-            # Stop at FROM, WHERE, GROUP BY, ORDER BY, etc.
-            if in_select and re.search(r'\b(FROM|WHERE|GROUP\s+BY|ORDER\s+BY|LIMIT|HAVING)\b', line, re.IGNORECASE):
-                in_select = False
+            # A stopping clause on the SELECT line itself ends the list there;
+            # otherwise the region runs up to the start of the stop's line
+            stop = stop_clause_re.search(sql, line_start)
+            if stop is not None and stop.start() < line_end:
+                pos = line_end
+                continue
+            region_end = sql.rfind('\n', 0, stop.start()) + 1 if stop is not None else n
             
-            if in_select:
-                # Extract column names: word characters, dots (for qualified columns)
-                # Match: col, t.col, schema.table.col, CAST(...), COUNT(*), etc.
-                col_pattern = r'(?:^|[,\s(])([\w.]+?)(?=[,\s)$]|$)'
-                matches = re.finditer(col_pattern, line)
-                
-                for match in matches:
-                    col_ref = match.group(1).strip()
-                    
-                    # Skip empty strings, SQL keywords, and numeric literals
-                    if col_ref and not re.match(r'^\d+$', col_ref) and col_ref.upper() not in ('SELECT', 'DISTINCT', 'AS', 'FROM', 'WHERE', 'GROUP', 'ORDER', 'BY', 'HAVING', 'JOIN', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'ON', 'LIMIT', 'OFFSET'):
-                        columns.append((line_num, col_ref))
-        
-        return columns
+            for match in col_re.finditer(sql, line_start, region_end):
+                # The token is never empty and holds no whitespace, so only
+                # SQL keywords and numeric literals need skipping
+                # (isdecimal matches exactly the characters \d does)
+                col_ref = match.group(1)
+                if not col_ref.isdecimal() and col_ref.upper() not in _COLUMN_KEYWORDS:
+                    col_start = match.start(1)
+                    newlines = sql.count('\n', last_pos, col_start)
+                    last_pos = col_start
+                    if newlines:
+                        line_num += newlines
+                        seen_on_line.clear()
+                    elif col_ref in seen_on_line:
+                        continue
+                    seen_on_line.add(col_ref)
+                    yield line_num, col_ref
+            
+            if stop is None:
+                break
+            # The stopping clause's line is never part of a column list
+            pos = sql.find('\n', stop.end())
+            if pos < 0:
+                break
     
     @staticmethod
     def is_unqualified(column: str) -> bool:
@@ -104,12 +164,14 @@ class RuleUnqualifiedColumns:
         Returns:
             True if unqualified, False if qualified or special
         """
-        # Skip aggregates and functions
-        if re.match(r'^(COUNT|SUM|AVG|MAX|MIN|DISTINCT|CAST|CASE|WHEN|THEN|ELSE|END)\b', column, re.IGNORECASE):
+        # Skip aggregates and functions. Extracted column references only hold
+        # word characters and dots, so the leading word ends at the first dot
+        # (or at '(' for calls such as COUNT(*) passed in directly)
+        if column.partition('.')[0].partition('(')[0].upper() in _AGG_KEYWORDS:
             return False
         
         # Skip constants and special values
-        if column in ('*', 'NULL', 'TRUE', 'FALSE'):
+        if column in _CONSTANTS:
             return False
         
         # Check if it has a dot (qualified)
@@ -120,12 +182,12 @@ class RuleUnqualifiedColumns:
         return True
     
     @staticmethod
-    def check(sql: str, file_name: str = "") -> List[LintResult]:
+    def check_context(ctx: LintContext, file_name: str = "") -> List[LintResult]:
         """
         Check for unqualified columns in SQL.
         
         Args:
-            sql: SQL query string to check
+            ctx: SQL of the file being checked, shared with the other rules
             file_name: Optional file name for reporting
             
         Returns:
@@ -133,62 +195,56 @@ class RuleUnqualifiedColumns:
         """
         violations = []
         
-        # Normalize SQL (remove comments)
-        normalized_sql = normalize_sql(sql)
-        
-        # Extract table aliases from FROM clause
-        aliases = RuleUnqualifiedColumns.extract_table_aliases(normalized_sql)
+        normalized_sql = ctx.normalized
         
-        # Only check if we found table aliases
-        if not aliases:
+        # Cheap substring prescreen: no SELECT means no column list to check
+        if 'select' not in ctx.lowered:
             return violations
         
-        # Extract columns from SELECT clause
-        columns = RuleUnqualifiedColumns.extract_select_columns(normalized_sql)
+        # Only check if the FROM clause has a table alias; the first one
+        # found is enough
+        aliases = RuleUnqualifiedColumns.extract_table_aliases(normalized_sql, ctx)
+        if next(aliases, None) is None:
+            return violations
         
-        # Check each column
-        seen = set()  # Avoid duplicate reports for same column on same line
-        for line_num, column in columns:
+        # Check each column from the SELECT clause (each is listed once per line)
+        for line_num, column in RuleUnqualifiedColumns.extract_select_columns(normalized_sql, ctx):
             if RuleUnqualifiedColumns.is_unqualified(column):
-                key = (line_num, column)
-                if key not in seen:
-                    result = LintResult(
-                        rule=RuleUnqualifiedColumns.RULE_NAME,
-                        severity=RuleUnqualifiedColumns.SEVERITY,
-                        line=line_num,
-                        file=file_name,
-                        message="Column appears unqualified. Use table alias.",
-                        description=RuleUnqualifiedColumns.RULE_DESCRIPTION
-                    )
-                    violations.append(result)
-                    seen.add(key)
+                result = LintResult(
+                    rule=RuleUnqualifiedColumns.RULE_NAME,
+                    severity=RuleUnqualifiedColumns.SEVERITY,
+                    line=line_num,
+                    file=file_name,
+                    message="Column appears unqualified. Use table alias.",
+                    description=RuleUnqualifiedColumns.RULE_DESCRIPTION
+                )
+                violations.append(result)
         
         return violations
     
     @staticmethod
-    def format_report(violations: List[LintResult]) -> str:
+    def iter_report(violations: List[LintResult]) -> Iterator[str]:
         """
-        Format violations into a readable report.
+        Yield the report for the given violations chunk by chunk.
         
         Args:
             violations: List of LintResult objects
             
-        Returns:
-            Formatted report string
+        Yields:
+            Report text chunks in output order
         """
         if not violations:
-            return f"✓ No {RuleUnqualifiedColumns.RULE_NAME} violations found\n"
-        
-        report = f"\n{'='*60}\n"
-        report += f"Rule: {RuleUnqualifiedColumns.RULE_NAME}\n"
-        report += f"Description: {RuleUnqualifiedColumns.RULE_DESCRIPTION}\n"
-        report += f"Severity: {RuleUnqualifiedColumns.SEVERITY}\n"
-        report += f"{'='*60}\n"
-        report += f"Found {len(violations)} violation(s):\n\n"
+            yield f"✓ No {RuleUnqualifiedColumns.RULE_NAME} violations found\n"
+            return
+        
+        yield (
+            f"\n{'='*60}\n"
+            f"Rule: {RuleUnqualifiedColumns.RULE_NAME}\n"
+            f"Description: {RuleUnqualifiedColumns.RULE_DESCRIPTION}\n"
+            f"Severity: {RuleUnqualifiedColumns.SEVERITY}\n"
+            f"{'='*60}\n"
+            f"Found {len(violations)} violation(s):\n\n"
+        )
         
         for violation in violations:
-            report += f"  File: {violation.file}\n"
-            report += f"  Line {violation.line}: {violation.message}\n"
-            report += "\n"
-        
-        return report
+            yield f"  File: {violation.file}\n  Line {violation.line}: {violation.message}\n\n"
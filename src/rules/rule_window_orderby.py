@@ -11,73 +11,99 @@ Example violation:
 """
 
 import re
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 try:
+    from models.lint_context import LintContext
     from models.lint_result import LintResult
-    from utils.sql_utils import normalize_sql
+    from utils.sql_utils import SqlPattern, line_at, newline_offsets
 except ImportError:
+    from ..models.lint_context import LintContext
     from ..models.lint_result import LintResult
-    from ..utils.sql_utils import normalize_sql
+    from ..utils.sql_utils import SqlPattern, line_at, newline_offsets
+from . import BaseRule, register
 
 
-class RuleWindowOrderBy:
+_ORDER_BY_RE = re.compile(r'\bORDER\s+BY\b', re.IGNORECASE)
+
+
+
+def _compile_window_call(functions: Iterable[str]) -> SqlPattern:
+    """
+    Compile the scanner for calls to the given window functions with OVER.
+    
+    Matches: ROW_NUMBER() OVER (...), LAG(amount) OVER (...), RANK() OVER (...), etc.
+    Pattern explanation: function_name ( arguments without parens ) OVER (
+    The function names are inlined instead of capturing any word and
+    looking it up afterwards. Attempts only start at the beginning of a
+    word whose first letter starts one of the names; that single class
+    check rejects most words before the name alternation is tried.
+    """
+    functions = sorted(functions, key=len, reverse=True)
+    first_letters = "".join(sorted({re.escape(fn[0]) for fn in functions}))
+    names = "|".join(map(re.escape, functions))
+    return SqlPattern(
+        r'\b(?=[' + first_letters + r'])(?P<fn>' + names + r')\s*\([^()]*\)\s*OVER\s*\(',
+        re.IGNORECASE,
+    )
+
+
+@register
+class RuleWindowOrderBy(BaseRule):
     """Detects window functions without ORDER BY in OVER() clause."""
     
     RULE_NAME = "WINDOW_MISSING_ORDER_BY"
     RULE_DESCRIPTION = "Window functions should include ORDER BY in OVER() clause"
     SEVERITY = "WARNING"
     
+    # Text that must appear in the normalized SQL for this rule to report anything
+    TRIGGER = r'OVER\s*\('
+    
     # Window functions that typically require ORDER BY
-    WINDOW_FUNCTIONS = {'ROW_NUMBER', 'RANK', 'DENSE_RANK', 'LAG', 'LEAD', 'NTILE', 
-                        'FIRST_VALUE', 'LAST_VALUE', 'NTH_VALUE'}
+    WINDOW_FUNCTIONS = frozenset({'ROW_NUMBER', 'RANK', 'DENSE_RANK', 'LAG', 'LEAD', 'NTILE',
+                                  'FIRST_VALUE', 'LAST_VALUE', 'NTH_VALUE'})
+    
+    _WINDOW_CALL_RE = _compile_window_call(WINDOW_FUNCTIONS)
     
     @staticmethod
-    def find_window_functions_with_over(sql: str) -> List[tuple]:
+    def find_window_functions_with_over(sql: str, ctx: Optional[LintContext] = None) -> Iterator[tuple]:
         """
         Find all window function calls with their OVER clauses.
         
+        The whole text is scanned at once, so calls and OVER clauses that
+        are broken across lines are found too.
+        
         Args:
             sql: SQL query string
+            ctx: Context whose normalized SQL is sql, to reuse its ASCII check
+                and newline offsets
             
-        Returns:
-            List of tuples (line_number, window_func_name, over_clause)
+        Yields:
+            Tuples (line_number, window_func_name, over_clause) in the order found
         """
-        lines = sql.split('\n')
-        results = []
+        offsets = None
         
-        # Pattern to match window functions followed by OVER clause
-        # Matches: ROW_NUMBER() OVER (...), LAG(amount) OVER (...), RANK() OVER (...), etc.
-        # Pattern explanation: function_name ( any_content ) OVER (
-        pattern = r'(\w+)\s*\([^)]*\)\s*OVER\s*\('
-        
-        for line_num, line in enumerate(lines, start=1):
-            # Find all matches on this line
-            matches = re.finditer(pattern, line, re.IGNORECASE)
+        # Only window functions we care about can match the call pattern
+        is_ascii = None if ctx is None else ctx.is_ascii
+        for match in RuleWindowOrderBy._WINDOW_CALL_RE.for_sql(sql, is_ascii).finditer(sql):
+            func_name = match.group('fn')
+            
+            # Find the matching closing paren for OVER(...)
+            over_start = match.end() - 1  # Position of opening paren
+            over_clause = RuleWindowOrderBy._extract_over_clause(sql, over_start)
             
-            for match in matches:
-                # Extract function name from the match
-                func_match = re.search(r'(\w+)\s*\(', match.group(0))
-                if func_match:
-                    func_name = func_match.group(1)
-                    
-                    # Check if it's a window function we care about
-                    if func_name.upper() in RuleWindowOrderBy.WINDOW_FUNCTIONS:
-                        # Find the matching closing paren for OVER(...)
-                        over_start = match.end() - 1  # Position of opening paren
-                        over_clause = RuleWindowOrderBy._extract_over_clause(line, over_start)
-                        
-                        if over_clause is not None:
-                            results.append((line_num, func_name, over_clause))
-        
-        return results
+            if over_clause is not None:
+                # Newline offsets are only needed once something is reported
+                if offsets is None:
+                    offsets = newline_offsets(sql) if ctx is None else ctx.newline_pos
+                yield line_at(offsets, match.start()), func_name, over_clause
     
     @staticmethod
     def _extract_over_clause(line: str, paren_start: int) -> str:
         """
-        Extract the complete OVER(...) clause from a line.
+        Extract the complete OVER(...) clause, which may span several lines.
         
         Args:
-            line: The line of SQL text
+            line: The SQL text (a single line or a whole file)
             paren_start: Index of the opening parenthesis
             
         Returns:
@@ -88,14 +114,19 @@ class RuleWindowOrderBy:
         
         paren_count = 1
         pos = paren_start + 1
-        
-        # Find matching closing parenthesis
-        while pos < len(line) and paren_count > 0:
-            if line[pos] == '(':
+        next_open = line.find('(', pos)
+        
+        # Find matching closing parenthesis, jumping between parens with
+        # str.find instead of stepping through every character
+        while paren_count > 0:
+            next_close = line.find(')', pos)
+            if next_close < 0:
+                break
+            while 0 <= next_open < next_close:
                 paren_count += 1
-            elif line[pos] == ')':
-                paren_count -= 1
-            pos += 1
+                next_open = line.find('(', next_open + 1)
+            paren_count -= 1
+            pos = next_close + 1
         
         if paren_count == 0:
             # Return content between parentheses
@@ -116,16 +147,15 @@ class RuleWindowOrderBy:
             True if ORDER BY is present, False otherwise
         """
         # Simple case-insensitive check for ORDER BY
-        pattern = r'\bORDER\s+BY\b'
-        return bool(re.search(pattern, over_clause, re.IGNORECASE))
+        return bool(_ORDER_BY_RE.search(over_clause))
     
     @staticmethod
-    def check(sql: str, file_name: str = "") -> List[LintResult]:
+    def check_context(ctx: LintContext, file_name: str = "") -> List[LintResult]:
         """
         Check for window functions without ORDER BY in OVER clause.
         
         Args:
-            sql: SQL query string to check
+            ctx: SQL of the file being checked, shared with the other rules
             file_name: Optional file name for reporting
             
         Returns:
@@ -133,11 +163,12 @@ class RuleWindowOrderBy:
         """
         violations = []
         
-        # Normalize SQL (remove comments)
-        normalized_sql = normalize_sql(sql)
+        # Cheap substring prescreen: no OVER means no window functions
+        if 'over' not in ctx.lowered:
+            return violations
         
         # Find all window functions with OVER clauses
-        window_funcs = RuleWindowOrderBy.find_window_functions_with_over(normalized_sql)
+        window_funcs = RuleWindowOrderBy.find_window_functions_with_over(ctx.normalized, ctx)
         
         # Check each window function
         for line_num, func_name, over_clause in window_funcs:
@@ -155,29 +186,28 @@ class RuleWindowOrderBy:
         return violations
     
     @staticmethod
-    def format_report(violations: List[LintResult]) -> str:
+    def iter_report(violations: List[LintResult]) -> Iterator[str]:
         """
-        Format violations into a readable report.
+        Yield the report for the given violations chunk by chunk.
         
         Args:
             violations: List of LintResult objects
             
-        Returns:
-            Formatted report string
+        Yields:
+            Report text chunks in output order
         """
         if not violations:
-            return f"✓ No {RuleWindowOrderBy.RULE_NAME} violations found\n"
-        
-        report = f"\n{'='*60}\n"
-        report += f"Rule: {RuleWindowOrderBy.RULE_NAME}\n"
-        report += f"Description: {RuleWindowOrderBy.RULE_DESCRIPTION}\n"
-        report += f"Severity: {RuleWindowOrderBy.SEVERITY}\n"
-        report += f"{'='*60}\n"
-        report += f"Found {len(violations)} violation(s):\n\n"
+            yield f"✓ No {RuleWindowOrderBy.RULE_NAME} violations found\n"
+            return
+        
+        yield (
+            f"\n{'='*60}\n"
+            f"Rule: {RuleWindowOrderBy.RULE_NAME}\n"
+            f"Description: {RuleWindowOrderBy.RULE_DESCRIPTION}\n"
+            f"Severity: {RuleWindowOrderBy.SEVERITY}\n"
+            f"{'='*60}\n"
+            f"Found {len(violations)} violation(s):\n\n"
+        )
         
         for violation in violations:
-            report += f"  File: {violation.file}\n"
-            report += f"  Line {violation.line}: {violation.message}\n"
-            report += "\n"
-        
-        return report
+            yield f"  File: {violation.file}\n  Line {violation.line}: {violation.message}\n\n"
@@ -0,0 +1,189 @@
+"""
+Disk cache of lint results keyed by file content.
+
+Unchanged files (the usual case when a directory is linted again during
+development or in CI) are answered from the cache instead of re-running
+every rule.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+try:
+    from models.lint_result import LintResult
+except ImportError:
+    from ..models.lint_result import LintResult
+
+
+DEFAULT_CACHE_DIR = '.snowflake_linter_cache'
+_CACHE_FILE = 'results.json'
+# Entries kept on disk; the least recently used are dropped beyond this
+DEFAULT_MAX_ENTRIES = 10000
+# Fields of a stored result row: rule, severity, line, message, description, column
+_ROW_FIELDS = 6
+
+
+def _is_valid_entry(entry: Any) -> bool:
+    """
+    Check that a loaded cache entry is a list of result rows.
+
+    Args:
+        entry: Value loaded from the cache file for one digest
+
+    Returns:
+        True if every row is a list with one item per stored field
+    """
+    return isinstance(entry, list) and all(
+        isinstance(row, list) and len(row) == _ROW_FIELDS for row in entry
+    )
+
+
+def content_digest(sql: str) -> str:
+    """
+    Hash SQL content for use as a cache key.
+
+    blake2b is faster than sha1 and collision-resistant enough to tell file
+    contents apart.
+
+    Args:
+        sql: SQL file content
+
+    Returns:
+        Hex digest of the UTF-8 encoded content
+    """
+    return hashlib.blake2b(sql.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """
+    Lint results by content digest, stored as JSON under a cache directory.
+
+    Entries are only valid for the rules that produced them: the cache is
+    stamped with a rules version and starts empty when the stamp differs.
+    Results are stored as compact rows without their file name, so a cached
+    entry answers for any file with the same content.
+
+    Entries are kept in least-recently-used order, and at most max_entries
+    of them are saved (more if this run used more), so old versions of
+    edited files eventually drop out instead of growing the file forever.
+    """
+
+    def __init__(self, cache_dir: str, rules_version: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Load the cache file from cache_dir, if there is a usable one.
+
+        Args:
+            cache_dir: Directory holding the cache file
+            rules_version: Stamp identifying the rule set in use
+            max_entries: Number of entries to keep when saving
+        """
+        self.path = os.path.join(cache_dir, _CACHE_FILE)
+        self.rules_version = rules_version
+        self.max_entries = max_entries
+        self._entries: Dict[str, List[list]] = {}
+        self._used = 0
+        self._dirty = False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable cache: start empty
+            return
+        if not isinstance(data, dict) or data.get('rules_version') != rules_version:
+            return
+        entries = data.get('entries')
+        if isinstance(entries, dict):
+            # Damaged entries are dropped, so they read as cache misses
+            self._entries = {
+                digest: entry for digest, entry in entries.items() if _is_valid_entry(entry)
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str, file_path: str) -> Optional[List[LintResult]]:
+        """
+        Look up the results for a content digest.
+
+        Args:
+            digest: Content digest from content_digest()
+            file_path: File the results are reported against
+
+        Returns:
+            List of LintResult violations, or None on a cache miss
+        """
+        entry = self._entries.pop(digest, None)
+        if entry is None:
+            return None
+        # Re-inserting moves the entry to the most recently used end
+        self._entries[digest] = entry
+        self._used += 1
+        return [
+            LintResult(rule=rule, severity=severity, line=line, file=file_path,
+                       message=message, description=description, column=column)
+            for rule, severity, line, message, description, column in entry
+        ]
+
+    def put(self, digest: str, violations: List[LintResult]) -> None:
+        """
+        Store the results for a content digest.
+
+        Args:
+            digest: Content digest from content_digest()
+            violations: List of LintResult violations for that content
+        """
+        entry = [
+            [v.rule, v.severity, v.line, v.message, v.description, v.column]
+            for v in violations
+        ]
+        self._entries.pop(digest, None)
+        self._entries[digest] = entry
+        self._used += 1
+        self._dirty = True
+
+    def save(self) -> None:
+        """
+        Write the cache file if anything was added since it was loaded.
+
+        Least recently used entries beyond max_entries are dropped first;
+        entries used in this run are always kept. The file is written to a
+        unique temporary file and moved into place, so an interrupted run
+        never leaves a truncated cache behind and linters sharing the cache
+        directory do not clobber each other's writes (the last one wins).
+        A cache that cannot be written only produces a warning on stderr.
+        """
+        if not self._dirty:
+            return
+
+        excess = len(self._entries) - max(self.max_entries, self._used)
+        if excess > 0:
+            for digest in list(self._entries)[:excess]:
+                del self._entries[digest]
+
+        # json.dumps runs the C encoder; json.dump to a file does not
+        data = json.dumps({'rules_version': self.rules_version, 'entries': self._entries},
+                          separators=(',', ':'))
+        cache_dir = os.path.dirname(self.path)
+        try:
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=_CACHE_FILE + '.', suffix='.tmp',
+                                            dir=cache_dir or None)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            print(f"Warning: could not save lint cache {self.path}: {e}", file=sys.stderr)
+            return
+        self._dirty = False
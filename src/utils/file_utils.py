@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Iterable, Iterator, Union
 
 
 def read_sql_file(file_path: str) -> str:
@@ -16,39 +16,70 @@ def read_sql_file(file_path: str) -> str:
         FileNotFoundError: If file does not exist
         IOError: If unable to read file
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
+    # open() raises FileNotFoundError itself; checking exists() first
+    # would cost an extra stat per file
     with open(file_path, 'r', encoding='utf-8') as f:
         return f.read()
 
 
-def get_sql_files(directory: str) -> List[str]:
+def get_sql_files(directory: str) -> Iterator[str]:
     """
     Get all SQL files in a directory.
     
+    Walks the tree with os.scandir, whose entries carry their file type, so
+    no extra stat is needed per entry. Files are yielded in the same order
+    as os.walk: each directory's files first, then its subdirectories.
+    Symlinked directories are not followed and unreadable directories are
+    skipped.
+    
     Args:
         directory: Directory path to search
         
-    Returns:
-        List of SQL file paths
+    Yields:
+        SQL file paths
     """
-    sql_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.sql'):
-                sql_files.append(os.path.join(root, file))
-    return sql_files
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            subdirs.append(entry)
+        elif entry.name.endswith('.sql'):
+            yield entry.path
+    
+    for entry in subdirs:
+        try:
+            if entry.is_symlink():
+                continue
+        except OSError:
+            continue
+        yield from get_sql_files(entry.path)
 
 
-def write_report(report_path: str, content: str) -> None:
+def write_report(report_path: str, chunks: Union[str, Iterable[str]]) -> None:
     """
     Write report to file.
     
+    Chunks are written through a 1 MiB buffer as they are produced, so the
+    full report never has to exist as one string.
+    
     Args:
         report_path: Path where report will be written
-        content: Report content
+        chunks: Iterable of report text chunks (a single string is also
+            accepted and written as one chunk)
     """
-    os.makedirs(os.path.dirname(report_path), exist_ok=True)
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    report_dir = os.path.dirname(report_path)
+    if report_dir:
+        os.makedirs(report_dir, exist_ok=True)
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(chunks)
@@ -1,5 +1,99 @@
 import re
-from typing import List, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple
+
+
+# SELECT * (case-insensitive, accounting for whitespace on the same line)
+# No word boundary after * since * is not a word character. Shared with
+# the SELECT_STAR rule.
+SELECT_STAR_RE = re.compile(r'\bselect[^\S\n]+\*', re.IGNORECASE)
+_NEWLINE_RE = re.compile(r'\n')
+
+# ASCII control characters that \s matches in Unicode mode but not with re.ASCII
+_UNICODE_ONLY_SPACES = '\x1c\x1d\x1e\x1f'
+
+# Each cached entry holds a whole file, so keep the cache small
+_NORMALIZE_CACHE_SIZE = 32
+
+
+def newline_offsets(sql: str) -> List[int]:
+    """
+    Find the offset of every newline in SQL text.
+    
+    Args:
+        sql: SQL query string
+        
+    Returns:
+        Sorted list of newline offsets, for use with line_at
+    """
+    return [m.start() for m in _NEWLINE_RE.finditer(sql)]
+
+
+def line_at(offsets: List[int], pos: int) -> int:
+    """
+    Convert a text offset to a line number.
+    
+    Args:
+        offsets: Newline offsets from newline_offsets
+        pos: Offset into the same text
+        
+    Returns:
+        Line number (1-indexed) containing pos
+    """
+    return bisect_left(offsets, pos) + 1
+
+
+def is_ascii_sql(sql: str) -> bool:
+    """
+    Check whether re.ASCII patterns match SQL text exactly as Unicode ones do.
+    
+    Args:
+        sql: SQL query string
+        
+    Returns:
+        True if the text is pure ASCII without the control characters that
+        only Unicode-mode \\s treats as whitespace
+    """
+    return sql.isascii() and not any(c in sql for c in _UNICODE_ONLY_SPACES)
+
+
+class SqlPattern:
+    """
+    A regex compiled twice: for Unicode text and with re.ASCII.
+    
+    On pure-ASCII text the re.ASCII twin gives the same matches while
+    skipping Unicode-aware \\w, \\s, \\b and case folding, which makes
+    scanning noticeably faster. Callers pick the variant once per text
+    with for_sql() and reuse it for every search on that text.
+    """
+    
+    __slots__ = ('unicode', 'ascii')
+    
+    def __init__(self, pattern: str, flags: int = 0):
+        self.unicode = re.compile(pattern, flags)
+        self.ascii = re.compile(pattern, flags | re.ASCII)
+    
+    @property
+    def pattern(self) -> str:
+        return self.unicode.pattern
+    
+    def for_sql(self, sql: str, is_ascii: Optional[bool] = None) -> Pattern:
+        """
+        Get the compiled pattern to use on sql (or on lines taken from it).
+        
+        Args:
+            sql: SQL text that will be searched
+            is_ascii: is_ascii_sql(sql) if already known, e.g. from
+                LintContext.is_ascii (checked here if omitted)
+            
+        Returns:
+            The re.ASCII pattern for plain ASCII text, the Unicode one otherwise
+        """
+        if is_ascii is None:
+            is_ascii = is_ascii_sql(sql)
+        return self.ascii if is_ascii else self.unicode
+
 
 def find_select_star_instances(sql: str) -> List[Tuple[int, str]]:
     """
@@ -11,32 +105,88 @@ def find_select_star_instances(sql: str) -> List[Tuple[int, str]]:
     Returns:
         List of tuples containing (line_number, matched_text)
     """
-    lines = sql.split('\n')
     instances = []
+    offsets = None
     
-    # Pattern to match SELECT * (case-insensitive, accounting for whitespace)
-    # No word boundary after * since * is not a word character
-    pattern = r'\bselect\s+\*'
-    
-    for line_num, line in enumerate(lines, start=1):
-        matches = re.finditer(pattern, line, re.IGNORECASE)
-        for match in matches:
-            instances.append((line_num, match.group()))
+    # One scan over the whole text; newline offsets are only computed
+    # once there is a match to place on a line
+    for match in SELECT_STAR_RE.finditer(sql):
+        if offsets is None:
+            offsets = newline_offsets(sql)
+        instances.append((line_at(offsets, match.start()), match.group()))
     
     return instances
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_sql(sql: str) -> str:
     """
     Normalize SQL for parsing (remove comments, extra whitespace).
     
+    Results are memoized on the raw SQL string, so rules checked one
+    after another on the same file strip its comments only once.
+    
+    Comments are removed in a single pass that jumps between '--' and '/*'
+    markers with str.find. A marker preceded by an odd number of quotes
+    since the last position outside a string is inside a single-quoted
+    literal and is left alone.
+    
     Args:
         sql: Raw SQL string
         
     Returns:
         Normalized SQL string
     """
-    # Remove SQL comments
-    sql = re.sub(r'--.*?$', '', sql, flags=re.MULTILINE)  # Remove -- comments
-    sql = re.sub(r'/\*.*?\*/', '', sql, flags=re.DOTALL)  # Remove /* */ comments
-    return sql
+    if '--' not in sql and '/*' not in sql:
+        return sql
+    
+    n = len(sql)
+    parts = []
+    i = 0
+    # Next position of each marker at or after i (n when there is none left)
+    line_pos = block_pos = -1
+    
+    while True:
+        if line_pos < i:
+            line_pos = sql.find('--', i)
+            if line_pos < 0:
+                line_pos = n
+        if block_pos < i:
+            block_pos = sql.find('/*', i)
+            if block_pos < 0:
+                block_pos = n
+        
+        pos = min(line_pos, block_pos)
+        if pos == n:
+            break
+        
+        if sql.count("'", i, pos) % 2:
+            # Inside a string literal: copy through its closing quote ('' escapes
+            # are just two adjacent literals); an unterminated one runs to EOF
+            end = sql.find("'", pos)
+            if end < 0:
+                break
+            parts.append(sql[i:end + 1])
+            i = end + 1
+            continue
+        
+        parts.append(sql[i:pos])
+        if pos == line_pos:
+            # Remove -- comments up to, but not including, the newline
+            end = sql.find('\n', pos + 2)
+            if end < 0:
+                i = n
+                break
+            i = end
+        else:
+            # Remove /* */ comments; an unterminated one is kept as text
+            end = sql.find('*/', pos + 2)
+            if end < 0:
+                parts.append('/*')
+                i = pos + 2
+                block_pos = n
+                continue
+            i = end + 2
+    
+    parts.append(sql[i:])
+    return ''.join(parts)
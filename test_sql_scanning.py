@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Fixed cases for the comment stripper and the SELECT-list and window scanners.
+
+Run from the repository root:
+    python -m unittest test_sql_scanning
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.rules import RuleUnqualifiedColumns, RuleWindowOrderBy
+from src.utils.sql_utils import normalize_sql
+
+
+class NormalizeSqlTest(unittest.TestCase):
+    """Comment stripping must leave string literals alone."""
+
+    def test_line_comment_removed(self):
+        self.assertEqual(normalize_sql("a -- c\nb"), "a \nb")
+
+    def test_dashes_inside_string_kept(self):
+        self.assertEqual(normalize_sql("SELECT '--x' AS a FROM t -- note\n"),
+                         "SELECT '--x' AS a FROM t \n")
+
+    def test_block_opener_inside_string_kept(self):
+        self.assertEqual(normalize_sql("SELECT '/*' AS a /* c */ FROM t"),
+                         "SELECT '/*' AS a  FROM t")
+
+    def test_doubled_quote_escape(self):
+        self.assertEqual(normalize_sql("SELECT 'it''s -- not' AS a -- c\nFROM t"),
+                         "SELECT 'it''s -- not' AS a \nFROM t")
+
+    def test_unterminated_quote_keeps_rest(self):
+        sql = "SELECT 'open -- x\nFROM t"
+        self.assertEqual(normalize_sql(sql), sql)
+
+    def test_unterminated_block_comment_kept(self):
+        sql = "SELECT a /* never closed\nFROM t"
+        self.assertEqual(normalize_sql(sql), sql)
+
+    def test_block_comment_across_lines_removed(self):
+        self.assertEqual(normalize_sql("SELECT a /* multi\nline */ FROM t"), "SELECT a  FROM t")
+
+
+class ExtractSelectColumnsTest(unittest.TestCase):
+    """Column lists run from a SELECT line up to the line of its stopping clause."""
+
+    def test_select_line_with_from_is_skipped(self):
+        sql = "SELECT a, b FROM t x\nSELECT\n  c,\n  d\nFROM t y"
+        self.assertEqual(list(RuleUnqualifiedColumns.extract_select_columns(sql)),
+                         [(3, 'c'), (4, 'd')])
+
+    def test_repeats_on_a_line_listed_once(self):
+        sql = "SELECT a, a,\n  a\nFROM t x"
+        self.assertEqual(list(RuleUnqualifiedColumns.extract_select_columns(sql)),
+                         [(1, 'a'), (2, 'a')])
+
+
+class WindowOverTest(unittest.TestCase):
+    """OVER clauses are read across line breaks."""
+
+    SQL = (
+        "SELECT\n"
+        "  RANK() OVER (PARTITION BY a\n"
+        "    ORDER BY b) AS r,\n"
+        "  ROW_NUMBER() OVER (\n"
+        "    PARTITION BY a\n"
+        "  ) AS n\n"
+        "FROM t"
+    )
+
+    def test_multiline_over_clauses(self):
+        found = list(RuleWindowOrderBy.find_window_functions_with_over(self.SQL))
+        self.assertEqual(found, [
+            (2, 'RANK', 'PARTITION BY a\n    ORDER BY b'),
+            (4, 'ROW_NUMBER', '\n    PARTITION BY a\n  '),
+        ])
+
+    def test_only_unordered_window_reported(self):
+        violations = RuleWindowOrderBy.check(self.SQL)
+        self.assertEqual([v.line for v in violations], [4])
+
+    def test_nested_call_checked(self):
+        sql = "SELECT COALESCE(RANK() OVER (PARTITION BY a), 0) FROM t"
+        self.assertEqual([v.line for v in RuleWindowOrderBy.check(sql)], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()